@@ -1,10 +1,12 @@
 """Trash file operations."""
 
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Iterator, Optional
 
 from googleapiclient.errors import HttpError
 
 from ..auth.service import DriveServiceFactory
+from ..common.constants import API_BATCH_SIZE, API_MAX_WORKERS
 from ..common.exceptions import ActionError
 from ..common.logging import get_logger
 from ..common.rate_limiter import TokenBucketRateLimiter
@@ -20,20 +22,27 @@ class TrashManager:
         self,
         service_factory: DriveServiceFactory,
         rate_limiter: TokenBucketRateLimiter,
+        batch_size: int = API_BATCH_SIZE,
+        max_workers: int = API_MAX_WORKERS,
     ) -> None:
         """Initialize trash manager.
 
         Args:
             service_factory: Factory for creating Drive API service
             rate_limiter: Rate limiter for API requests
+            batch_size: Number of trash requests sent per batch HTTP call
+            max_workers: Number of batches in flight at once
         """
         self.service_factory = service_factory
         self.rate_limiter = rate_limiter
+        self.batch_size = batch_size
+        self.max_workers = max_workers
 
-    @exponential_backoff()
     def trash_file(self, file_id: str, dry_run: bool = False) -> bool:
         """Trash a single file.
 
+        Rate limit (429) and server (5xx) errors are retried with backoff.
+
         Args:
             file_id: File ID to trash
             dry_run: If True, don't actually trash the file
@@ -49,14 +58,7 @@ class TrashManager:
             return True
 
         try:
-            service = self.service_factory.create_service()
-            self.rate_limiter.acquire()
-
-            # SAFETY INVARIANT: Only update trashed=True, never use files.delete()
-            service.files().update(
-                fileId=file_id,
-                body={"trashed": True},
-            ).execute()
+            self._update_trashed(file_id)
 
             logger.info(f"Trashed file: {file_id}")
             return True
@@ -69,25 +71,124 @@ class TrashManager:
         except Exception as e:
             raise ActionError(f"Failed to trash file {file_id}: {e}") from e
 
-    def trash_files(self, file_ids: list[str], dry_run: bool = False) -> dict[str, bool]:
-        """Trash multiple files.
+    @exponential_backoff()
+    def _update_trashed(self, file_id: str) -> None:
+        """Mark a file as trashed, letting HttpError reach the retry decorator.
 
         Args:
-            file_ids: List of file IDs to trash
+            file_id: File ID to trash
+        """
+        service = self.service_factory.get_service()
+        self.rate_limiter.acquire()
+
+        # SAFETY INVARIANT: Only update trashed=True, never use files.delete()
+        service.files().update(
+            fileId=file_id,
+            body={"trashed": True},
+        ).execute()
+
+    def trash_batch(self, file_ids: list[str], dry_run: bool = False) -> dict[str, bool]:
+        """Trash a batch of files in a single batch HTTP request.
+
+        Sub-requests that fail with a retryable error (429 or 5xx), or a batch
+        that fails as a whole, fall back to trash_file() with backoff.
+
+        Args:
+            file_ids: File IDs to trash (at most batch_size is recommended)
             dry_run: If True, don't actually trash files
 
         Returns:
             Dictionary mapping file ID to success status
         """
-        results = {}
+        if dry_run:
+            for file_id in file_ids:
+                logger.info(f"[DRY RUN] Would trash file: {file_id}")
+            return {file_id: True for file_id in file_ids}
+
+        results: dict[str, bool] = {}
+        retry_ids: list[str] = []
+
+        def callback(request_id: str, response: Any, exception: Optional[Exception]) -> None:
+            if exception is None:
+                logger.info(f"Trashed file: {request_id}")
+                results[request_id] = True
+            elif isinstance(exception, HttpError) and exception.resp.status == 404:
+                logger.warning(f"File not found: {request_id}")
+                results[request_id] = False
+            elif isinstance(exception, HttpError) and (
+                exception.resp.status == 429 or exception.resp.status >= 500
+            ):
+                retry_ids.append(request_id)
+            else:
+                logger.error(f"Failed to trash {request_id}: {exception}")
+                results[request_id] = False
 
-        for file_id in file_ids:
+        try:
+            service = self.service_factory.get_service()
+            batch = service.new_batch_http_request(callback=callback)
+
+            for file_id in file_ids:
+                # Drive quota counts each sub-request, so pace them individually
+                self.rate_limiter.acquire()
+                # SAFETY INVARIANT: Only update trashed=True, never use files.delete()
+                batch.add(
+                    service.files().update(fileId=file_id, body={"trashed": True}),
+                    request_id=file_id,
+                )
+
+            batch.execute()
+        except Exception as e:
+            logger.warning(f"Batch trash request failed, retrying individually: {e}")
+            retry_ids = [file_id for file_id in file_ids if file_id not in results]
+
+        for file_id in retry_ids:
             try:
-                results[file_id] = self.trash_file(file_id, dry_run)
+                results[file_id] = self.trash_file(file_id)
             except ActionError as e:
                 logger.error(f"Failed to trash {file_id}: {e}")
                 results[file_id] = False
 
+        return results
+
+    def iter_trash_batches(
+        self, file_ids: list[str], dry_run: bool = False
+    ) -> Iterator[dict[str, bool]]:
+        """Trash files in concurrent batches.
+
+        Each worker thread reuses its own Drive service (see
+        DriveServiceFactory.get_service), since the HTTP client is not thread-safe.
+
+        Args:
+            file_ids: List of file IDs to trash
+            dry_run: If True, don't actually trash files
+
+        Yields:
+            Results of each batch (file ID to success status) as it completes
+        """
+        batches = [
+            file_ids[i : i + self.batch_size]
+            for i in range(0, len(file_ids), self.batch_size)
+        ]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self.trash_batch, batch, dry_run) for batch in batches]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def trash_files(self, file_ids: list[str], dry_run: bool = False) -> dict[str, bool]:
+        """Trash multiple files.
+
+        Args:
+            file_ids: List of file IDs to trash
+            dry_run: If True, don't actually trash files
+
+        Returns:
+            Dictionary mapping file ID to success status
+        """
+        results: dict[str, bool] = {}
+        for batch_results in self.iter_trash_batches(file_ids, dry_run):
+            results.update(batch_results)
+
         successful = sum(1 for success in results.values() if success)
         logger.info(
             f"Trashed {successful}/{len(file_ids)} files "
@@ -1,5 +1,6 @@
 """Google Drive API service factory."""
 
+import threading
 from typing import Any
 
 from googleapiclient.discovery import build
@@ -22,6 +23,7 @@ class DriveServiceFactory:
             oauth_manager: OAuth manager for authentication
         """
         self.oauth_manager = oauth_manager
+        self._local = threading.local()
 
     def create_service(self) -> Any:
         """Create authenticated Drive API service.
@@ -45,6 +47,24 @@ class DriveServiceFactory:
         except Exception as e:
             raise AuthenticationError(f"Failed to create Drive service: {e}") from e
 
+    def get_service(self) -> Any:
+        """Get a Drive API service cached for the calling thread.
+
+        Building a service is expensive, but the underlying HTTP client is not
+        thread-safe, so each thread gets its own instance that it reuses.
+
+        Returns:
+            Google Drive API service instance
+
+        Raises:
+            AuthenticationError: If not authenticated
+        """
+        service = getattr(self._local, "service", None)
+        if service is None:
+            service = self.create_service()
+            self._local.service = service
+        return service
+
 
 def set_request_timeout(request: HttpRequest, timeout: int = 60) -> HttpRequest:
     """Set timeout for API request.
@@ -9,7 +9,7 @@ from ..actions.strategies import get_strategy
 from ..actions.trash import TrashManager
 from ..auth.oauth import OAuthManager
 from ..auth.service import DriveServiceFactory
-from ..common.exceptions import ActionError, AuthenticationError
+from ..common.exceptions import AuthenticationError
 from ..common.rate_limiter import TokenBucketRateLimiter
 from ..config.settings import get_settings
 from ..detector.pipeline import DetectionPipeline
@@ -81,8 +81,13 @@ def delete(
 
             # Filter groups based on same-folder-only flag
             if same_folder_only:
-                same_folder_groups = [g for g in duplicate_groups if g.are_all_in_same_folder()]
-                cross_folder_groups = [g for g in duplicate_groups if not g.are_all_in_same_folder()]
+                same_folder_groups = []
+                cross_folder_groups = []
+                for g in duplicate_groups:
+                    if g.are_all_in_same_folder():
+                        same_folder_groups.append(g)
+                    else:
+                        cross_folder_groups.append(g)
 
                 if cross_folder_groups:
                     cross_folder_files = sum(g.count for g in cross_folder_groups)
@@ -154,15 +159,9 @@ def delete(
                     total=len(file_ids),
                 )
 
-                for file_id in file_ids:
-                    try:
-                        success = trash_manager.trash_file(file_id, dry_run)
-                        results[file_id] = success
-                    except ActionError as e:
-                        print_error(f"Failed to trash {file_id}: {e}")
-                        results[file_id] = False
-
-                    progress.update(task, advance=1)
+                for batch_results in trash_manager.iter_trash_batches(file_ids, dry_run):
+                    results.update(batch_results)
+                    progress.update(task, advance=len(batch_results))
 
             # Summary
             successful = sum(1 for success in results.values() if success)
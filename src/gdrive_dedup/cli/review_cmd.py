@@ -8,11 +8,16 @@ from humanize import naturalsize
 from ..config.settings import get_settings
 from ..detector.pipeline import DetectionPipeline
 from ..scanner.file_index import FileIndex
-from .formatters import create_table, print_error, print_info, print_success
+from .formatters import console, create_table, print_error, print_info, print_success
 
 review_app = typer.Typer(help="Review duplicate files interactively")
 
 
+def _truncate(text: str, width: int) -> str:
+    """Truncate text to width characters, ending with an ellipsis if cut."""
+    return text if len(text) <= width else text[: width - 3] + "..."
+
+
 @review_app.command()
 def review(
     group_id: Optional[int] = typer.Option(
@@ -24,6 +29,9 @@ def review(
     min_size: int = typer.Option(
         0, "--min-size", help="Minimum file size in bytes"
     ),
+    limit: int = typer.Option(
+        50, "--limit", "-n", help="Maximum number of groups to display (0 for all)"
+    ),
 ) -> None:
     """Interactively review duplicate file groups."""
     settings = get_settings()
@@ -60,10 +68,18 @@ def review(
                     print_error(f"Group {group_id} not found")
                     raise typer.Exit(1)
 
+            total_groups = len(duplicate_groups)
+            total_wasted = sum(g.wasted_size for g in duplicate_groups)
+
+            # Only render the first page of groups unless a specific group was requested
+            shown_groups = duplicate_groups
+            if group_id is None and limit > 0:
+                shown_groups = duplicate_groups[:limit]
+
             # Display groups
-            print_info(f"Found {len(duplicate_groups)} duplicate groups\n")
+            print_info(f"Found {total_groups} duplicate groups\n")
 
-            for group in duplicate_groups:
+            for group in shown_groups:
                 print_info(
                     f"Group {group.group_id}: {group.count} files, "
                     f"{naturalsize(group.size)} each, "
@@ -80,17 +96,21 @@ def review(
                 for file in group.files:
                     table.add_row(
                         file.file_id,
-                        file.name[:37] + "..." if len(file.name) > 40 else file.name,
+                        _truncate(file.name, 40),
                         file.modified_time.strftime("%Y-%m-%d %H:%M"),
-                        file.path[:60] + "..." if len(file.path) > 63 else file.path,
+                        _truncate(file.path, 63),
                     )
 
-                from .formatters import console
                 console.print(table)
                 print_info("")
 
-            print_info(f"\nTotal groups: {len(duplicate_groups)}")
-            total_wasted = sum(g.wasted_size for g in duplicate_groups)
+            if len(shown_groups) < total_groups:
+                print_info(
+                    f"Showing {len(shown_groups)} of {total_groups} groups "
+                    "(use --limit 0 to show all)"
+                )
+
+            print_info(f"\nTotal groups: {total_groups}")
             print_info(f"Total wasted space: {naturalsize(total_wasted)}")
 
     except Exception as e:
@@ -7,6 +7,7 @@ from humanize import naturalsize
 
 from ..auth.oauth import OAuthManager
 from ..auth.service import DriveServiceFactory
+from ..common.constants import INDEX_COMMIT_INTERVAL
 from ..common.exceptions import AuthenticationError, ScanError
 from ..common.rate_limiter import TokenBucketRateLimiter
 from ..config.settings import get_settings
@@ -88,36 +89,48 @@ def scan(
             print_info("Scanning Google Drive...")
             progress = create_progress()
 
-            with progress:
-                task = progress.add_task(
-                    "[cyan]Scanning files...",
-                    total=None,
-                )
-
-                files_scanned = 0
-                batch = []
-
-                for file_record in scanner.scan_files(
-                    folder_id=folder,
-                    owned_only=owned_only,
-                    min_size=min_size,
-                ):
-                    batch.append(file_record)
-                    files_scanned += 1
-
-                    # Batch insert for performance
-                    if len(batch) >= settings.batch_size:
+            try:
+                with progress, file_index.bulk_load():
+                    task = progress.add_task(
+                        "[cyan]Scanning files...",
+                        total=None,
+                    )
+
+                    files_scanned = 0
+                    files_committed = 0
+                    batch = []
+
+                    for file_record in scanner.scan_files(
+                        folder_id=folder,
+                        owned_only=owned_only,
+                        min_size=min_size,
+                    ):
+                        batch.append(file_record)
+                        files_scanned += 1
+
+                        # Batch insert for performance
+                        if len(batch) >= settings.batch_size:
+                            file_index.add_files(batch)
+                            batch = []
+
+                            # Commit in large transactions rather than per batch
+                            if files_scanned - files_committed >= INDEX_COMMIT_INTERVAL:
+                                file_index.commit()
+                                files_committed = files_scanned
+
+                            checkpoint.update(None, files_scanned)
+
+                        progress.update(task, completed=files_scanned)
+
+                    # Insert remaining files
+                    if batch:
                         file_index.add_files(batch)
-                        batch = []
-                        checkpoint.save(None, files_scanned)
-
-                    progress.update(task, completed=files_scanned)
-
-                # Insert remaining files
-                if batch:
-                    file_index.add_files(batch)
 
-                progress.update(task, description="[green]Scan complete!")
+                    progress.update(task, description="[green]Scan complete!")
+            except BaseException:
+                # Make sure the latest checkpoint reaches disk if the scan fails
+                checkpoint.close()
+                raise
 
             checkpoint.clear()
             print_success(f"Scanned {files_scanned} files")
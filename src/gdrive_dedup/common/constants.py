@@ -18,11 +18,16 @@ WORKSPACE_MIME_TYPES = {
 # API limits
 PAGE_SIZE = 1000
 BATCH_SIZE = 100
+API_BATCH_SIZE = 25  # sub-requests per batch HTTP call (larger batches risk server 500s)
+API_MAX_WORKERS = 4  # concurrent in-flight API calls (the rate limiter still caps throughput)
 DEFAULT_RATE_LIMIT = 10  # requests per second
 
 # File index
 INDEX_DB_NAME = "file_index.db"
 CHECKPOINT_FILE = "scan_checkpoint.json"
+INDEX_COMMIT_INTERVAL = 10_000  # files inserted per transaction during a scan
+CHECKPOINT_INTERVAL_FILES = 1000  # files scanned between checkpoint writes
+CHECKPOINT_INTERVAL_SECONDS = 5.0  # ...or seconds elapsed, whichever comes first
 
 # Token storage
 TOKEN_FILE = "token.json"
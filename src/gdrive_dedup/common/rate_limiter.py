@@ -1,7 +1,7 @@
 """Token bucket rate limiter."""
 
 import time
-from threading import Lock
+from threading import Condition
 from typing import Optional
 
 
@@ -19,7 +19,7 @@ class TokenBucketRateLimiter:
         self.capacity = capacity or rate
         self.tokens = self.capacity
         self.last_update = time.monotonic()
-        self.lock = Lock()
+        self.cond = Condition()
 
     def acquire(self, tokens: int = 1, blocking: bool = True) -> bool:
         """Acquire tokens, optionally blocking until available.
@@ -31,7 +31,7 @@ class TokenBucketRateLimiter:
         Returns:
             True if tokens acquired, False if not available and non-blocking
         """
-        with self.lock:
+        with self.cond:
             while True:
                 now = time.monotonic()
                 elapsed = now - self.last_update
@@ -40,10 +40,14 @@ class TokenBucketRateLimiter:
 
                 if self.tokens >= tokens:
                     self.tokens -= tokens
+                    # Let other waiters re-check; there may be tokens left over
+                    if self.tokens >= 1:
+                        self.cond.notify_all()
                     return True
 
                 if not blocking:
                     return False
 
-                sleep_time = (tokens - self.tokens) / self.rate
-                time.sleep(sleep_time)
+                # Wait off-lock so other threads can check the bucket meanwhile
+                wait_time = (tokens - self.tokens) / self.rate
+                self.cond.wait(timeout=wait_time)
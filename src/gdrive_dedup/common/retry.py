@@ -1,6 +1,7 @@
 """Exponential backoff retry decorator."""
 
 import functools
+import random
 import time
 from typing import Any, Callable, TypeVar, cast
 
@@ -21,6 +22,9 @@ def exponential_backoff(
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """Retry with exponential backoff for transient errors.
 
+    Uses full jitter: each retry sleeps a random time between zero and the
+    current backoff delay, so concurrent callers don't retry in lockstep.
+
     Args:
         max_retries: Maximum number of retry attempts
         base_delay: Initial delay in seconds
@@ -50,11 +54,12 @@ def exponential_backoff(
                             raise RateLimitError("Rate limit exceeded") from e
                         raise
 
+                    sleep_for = random.uniform(0, delay)
                     logger.warning(
                         f"Request failed (attempt {attempt + 1}/{max_retries + 1}): {e}. "
-                        f"Retrying in {delay:.1f}s..."
+                        f"Retrying in {sleep_for:.1f}s..."
                     )
-                    time.sleep(delay)
+                    time.sleep(sleep_for)
                     delay = min(delay * 2, max_delay)
                 except Exception as e:
                     # Don't retry other exceptions
@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FileRecord:
     """Represents a file in Google Drive."""
 
@@ -27,7 +27,7 @@ class FileRecord:
         return self.mime_type in WORKSPACE_MIME_TYPES
 
 
-@dataclass
+@dataclass(slots=True)
 class DuplicateGroup:
     """A group of duplicate files."""
 
@@ -76,9 +76,7 @@ class DuplicateGroup:
         if len(self.files) <= 1:
             return True
 
-        # Extract folder path (everything before the last /)
-        def get_folder(path: str) -> str:
-            return path.rsplit('/', 1)[0] if '/' in path else ''
-
-        folders = {get_folder(f.path) for f in self.files}
-        return len(folders) == 1
+        # Folder path is everything before the last / (empty if there is none);
+        # stop at the first file outside the first file's folder
+        folder = self.files[0].path.rpartition('/')[0]
+        return all(f.path.rpartition('/')[0] == folder for f in self.files[1:])
@@ -1,8 +1,10 @@
 """CSV and JSON export functionality."""
 
 import csv
-import json
 from pathlib import Path
+from typing import Any
+
+import orjson
 
 from ..common.logging import get_logger
 from ..detector.models import DuplicateGroup
@@ -22,7 +24,7 @@ class ReportExporter:
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w", newline="") as f:
+        with open(output_path, "w", newline="", buffering=1 << 20) as f:
             writer = csv.writer(f)
 
             # Header
@@ -39,61 +41,79 @@ class ReportExporter:
             ])
 
             # Data
-            for group in groups:
-                for file in group.files:
-                    writer.writerow([
-                        group.group_id,
-                        file.file_id,
-                        file.name,
-                        file.size,
-                        file.md5,
-                        file.created_time.isoformat(),
-                        file.modified_time.isoformat(),
-                        file.path,
-                        file.owned_by_me,
-                    ])
+            writer.writerows(
+                (
+                    group.group_id,
+                    file.file_id,
+                    file.name,
+                    file.size,
+                    file.md5,
+                    file.created_time.isoformat(),
+                    file.modified_time.isoformat(),
+                    file.path,
+                    file.owned_by_me,
+                )
+                for group in groups
+                for file in group.files
+            )
 
         logger.info(f"Exported {len(groups)} groups to CSV: {output_path}")
 
     def export_json(self, groups: list[DuplicateGroup], output_path: Path) -> None:
         """Export duplicate groups to JSON.
 
+        Groups are serialized and written one at a time (one per line) so the
+        whole report never has to be built in memory.
+
         Args:
             groups: List of duplicate groups
             output_path: Output file path
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        data = {
+        header = {
             "total_groups": len(groups),
             "total_files": sum(g.count for g in groups),
             "total_wasted_space": sum(g.wasted_size for g in groups),
-            "groups": [
-                {
-                    "group_id": group.group_id,
-                    "size": group.size,
-                    "md5": group.md5,
-                    "count": group.count,
-                    "wasted_size": group.wasted_size,
-                    "files": [
-                        {
-                            "file_id": f.file_id,
-                            "name": f.name,
-                            "size": f.size,
-                            "md5": f.md5,
-                            "created_time": f.created_time.isoformat(),
-                            "modified_time": f.modified_time.isoformat(),
-                            "path": f.path,
-                            "owned_by_me": f.owned_by_me,
-                        }
-                        for f in group.files
-                    ],
-                }
-                for group in groups
-            ],
         }
 
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(output_path, "wb") as f:
+            # Open the header object and append the groups array to it
+            f.write(orjson.dumps(header)[:-1] + b',"groups":[')
+            for i, group in enumerate(groups):
+                f.write(b"\n" if i == 0 else b",\n")
+                f.write(orjson.dumps(self._group_to_dict(group)))
+            f.write(b"\n]}\n")
 
         logger.info(f"Exported {len(groups)} groups to JSON: {output_path}")
+
+    def _group_to_dict(self, group: DuplicateGroup) -> dict[str, Any]:
+        """Convert a duplicate group to a JSON-serializable dict.
+
+        Args:
+            group: Duplicate group
+
+        Returns:
+            Dictionary with group fields and its files (datetimes are left to
+            orjson, which emits the same ISO 8601 format as isoformat())
+        """
+        return {
+            "group_id": group.group_id,
+            "size": group.size,
+            "md5": group.md5,
+            "count": group.count,
+            "wasted_size": group.wasted_size,
+            "files": [
+                {
+                    "file_id": f.file_id,
+                    "name": f.name,
+                    "size": f.size,
+                    "md5": f.md5,
+                    "created_time": f.created_time,
+                    "modified_time": f.modified_time,
+                    "path": f.path,
+                    "owned_by_me": f.owned_by_me,
+                }
+                for f in group.files
+            ],
+        }
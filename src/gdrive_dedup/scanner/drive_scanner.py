@@ -1,10 +1,12 @@
 """Google Drive file scanner."""
 
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Iterator, Optional
+from typing import Any, Iterable, Iterator, Optional
 
 from ..auth.service import DriveServiceFactory
-from ..common.constants import PAGE_SIZE, WORKSPACE_MIME_TYPES
+from ..common.constants import API_BATCH_SIZE, PAGE_SIZE, WORKSPACE_MIME_TYPES
 from ..common.exceptions import ScanError
 from ..common.logging import get_logger
 from ..common.rate_limiter import TokenBucketRateLimiter
@@ -13,6 +15,21 @@ from ..detector.models import FileRecord
 
 logger = get_logger(__name__)
 
+# Fields to retrieve when listing files (trashed is implied by the query;
+# parents are needed for path resolution)
+_LIST_FIELDS = (
+    "nextPageToken, files(id, name, size, md5Checksum, mimeType, "
+    "createdTime, modifiedTime, parents, ownedByMe)"
+)
+
+if sys.version_info >= (3, 11):
+    # Handles the trailing "Z" in Drive timestamps natively
+    _parse_timestamp = datetime.fromisoformat
+else:
+    def _parse_timestamp(value: str) -> datetime:
+        """Parse an RFC 3339 timestamp as returned by the Drive API."""
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
 
 class DriveScanner:
     """Scans Google Drive for files and metadata."""
@@ -34,6 +51,8 @@ class DriveScanner:
         self.rate_limiter = rate_limiter
         self.page_size = page_size
         self._folder_cache: dict[str, str] = {}
+        self._parent_cache: dict[str, Optional[str]] = {}
+        self._id_to_full_path: dict[str, str] = {}
 
     @exponential_backoff()
     def scan_files(
@@ -56,8 +75,6 @@ class DriveScanner:
             ScanError: If scan fails
         """
         try:
-            service = self.service_factory.create_service()
-
             # Build query
             query_parts = ["trashed = false"]
 
@@ -73,59 +90,79 @@ class DriveScanner:
 
             query = " and ".join(query_parts)
 
-            # Fields to retrieve
-            fields = (
-                "nextPageToken, files(id, name, size, md5Checksum, mimeType, "
-                "createdTime, modifiedTime, parents, trashed, ownedByMe)"
-            )
-
-            page_token = None
             total_files = 0
 
-            while True:
-                self.rate_limiter.acquire()
-
-                response = (
-                    service.files()
-                    .list(
-                        q=query,
-                        pageSize=self.page_size,
-                        pageToken=page_token,
-                        fields=fields,
-                        orderBy="modifiedTime desc",
-                    )
-                    .execute()
+            # The next page is requested in the background as soon as its
+            # token is known, so its round trip overlaps with resolving
+            # folders and consuming the current page
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                pending: Optional[Future[dict[str, Any]]] = executor.submit(
+                    self._list_page, query, None
                 )
 
-                files = response.get("files", [])
-
-                for file_data in files:
-                    # Skip files without size or MD5
-                    if "size" not in file_data or "md5Checksum" not in file_data:
-                        continue
+                while pending is not None:
+                    response = pending.result()
 
-                    # Apply client-side size filter
-                    file_size = int(file_data.get("size", 0))
-                    if file_size < min_size:
-                        continue
+                    page_token = response.get("nextPageToken")
+                    pending = (
+                        executor.submit(self._list_page, query, page_token)
+                        if page_token
+                        else None
+                    )
 
-                    try:
-                        file_record = self._parse_file(file_data)
-                        yield file_record
-                        total_files += 1
-                    except Exception as e:
-                        logger.warning(f"Failed to parse file {file_data.get('id')}: {e}")
-                        continue
+                    files = [
+                        file_data
+                        for file_data in response.get("files", [])
+                        # Skip files without size or MD5, and apply client-side size filter
+                        if "size" in file_data
+                        and "md5Checksum" in file_data
+                        and int(file_data["size"]) >= min_size
+                    ]
+
+                    # Resolve this page's folders up front so path lookups stay in memory
+                    self._prefetch_folders(
+                        file_data["parents"][0] for file_data in files if file_data.get("parents")
+                    )
 
-                page_token = response.get("nextPageToken")
-                if not page_token:
-                    break
+                    for file_data in files:
+                        try:
+                            file_record = self._parse_file(file_data)
+                            yield file_record
+                            total_files += 1
+                        except Exception as e:
+                            logger.warning(f"Failed to parse file {file_data.get('id')}: {e}")
+                            continue
 
             logger.info(f"Scanned {total_files} files")
 
         except Exception as e:
             raise ScanError(f"Failed to scan drive: {e}") from e
 
+    def _list_page(self, query: str, page_token: Optional[str]) -> dict[str, Any]:
+        """Fetch one page of the file listing.
+
+        Args:
+            query: Drive search query
+            page_token: Token of the page to fetch (None for the first page)
+
+        Returns:
+            Drive API files.list response
+        """
+        self.rate_limiter.acquire()
+
+        service = self.service_factory.get_service()
+        response: dict[str, Any] = (
+            service.files()
+            .list(
+                q=query,
+                pageSize=self.page_size,
+                pageToken=page_token,
+                fields=_LIST_FIELDS,
+            )
+            .execute()
+        )
+        return response
+
     def get_file_path(self, file_id: str, parents: list[str]) -> str:
         """Get full path to a file.
 
@@ -139,69 +176,148 @@ class DriveScanner:
         if not parents:
             return "/"
 
-        path_parts = []
-        current_id = parents[0]
+        cached_path = self._id_to_full_path.get(parents[0])
+        if cached_path is not None:
+            return cached_path
+
+        # Walk up the parent chain until the root or an already-resolved folder
+        chain: list[str] = []
+        path = "/"
+        current_id: Optional[str] = parents[0]
+        resolved = True
 
-        # Walk up the parent chain
         while current_id:
-            if current_id in self._folder_cache:
-                folder_name = self._folder_cache[current_id]
-            else:
-                folder_name = self._fetch_folder_name(current_id)
-                self._folder_cache[current_id] = folder_name
+            if current_id in self._id_to_full_path:
+                path = self._id_to_full_path[current_id]
+                break
 
-            if folder_name:
-                path_parts.insert(0, folder_name)
+            if current_id not in self._folder_cache:
+                folder = self._fetch_folder(current_id)
+                if folder is None:
+                    # Leave the folder uncached so the next file retries it
+                    resolved = False
+                    break
+                self._folder_cache[current_id], self._parent_cache[current_id] = folder
+            chain.append(current_id)
 
             # Get parent of this folder
-            parent_id = self._fetch_parent_id(current_id)
-            if not parent_id or parent_id == current_id:
+            parent_id = self._parent_cache[current_id]
+            if not parent_id or parent_id in chain:
                 break
             current_id = parent_id
 
-        return "/" + "/".join(path_parts) if path_parts else "/"
+        # Build paths back down the chain, caching every ancestor on the way
+        # unless a failed lookup left the path truncated
+        for folder_id in reversed(chain):
+            folder_name = self._folder_cache[folder_id]
+            if folder_name:
+                path = (path if path != "/" else "") + "/" + folder_name
+            if resolved:
+                self._id_to_full_path[folder_id] = path
 
-    @exponential_backoff()
-    def _fetch_folder_name(self, folder_id: str) -> str:
-        """Fetch folder name by ID.
+        return path
+
+    def _prefetch_folders(self, folder_ids: Iterable[str]) -> None:
+        """Fetch unknown folders and all their ancestors using batch requests.
+
+        Each level of the tree is fetched in batches of API_BATCH_SIZE, then
+        the newly discovered parents are fetched, until the root is reached.
+        Folders that fail here are left uncached and retried individually by
+        get_file_path().
 
         Args:
-            folder_id: Folder ID
+            folder_ids: Folder IDs that need to be resolved
+        """
+        attempted: set[str] = set()
+        pending = {
+            folder_id
+            for folder_id in folder_ids
+            if folder_id not in self._folder_cache and folder_id not in self._id_to_full_path
+        }
+
+        while pending:
+            attempted.update(pending)
+            pending_ids = sorted(pending)
+            for i in range(0, len(pending_ids), API_BATCH_SIZE):
+                self._fetch_folder_batch(pending_ids[i : i + API_BATCH_SIZE])
+
+            pending = {
+                parent_id
+                for folder_id in pending_ids
+                if (parent_id := self._parent_cache.get(folder_id))
+                and parent_id not in self._folder_cache
+                and parent_id not in attempted
+            }
+
+    def _fetch_folder_batch(self, folder_ids: list[str]) -> None:
+        """Fetch names and parents of several folders in one batch request.
 
-        Returns:
-            Folder name
+        Args:
+            folder_ids: Folder IDs to fetch (at most API_BATCH_SIZE)
         """
+
+        def callback(request_id: str, response: Any, exception: Optional[Exception]) -> None:
+            if exception is not None:
+                logger.debug(f"Failed to prefetch folder {request_id}: {exception}")
+                return
+            parents = response.get("parents", [])
+            self._folder_cache[request_id] = response.get("name", "")
+            self._parent_cache[request_id] = parents[0] if parents else None
+
         try:
-            service = self.service_factory.create_service()
-            self.rate_limiter.acquire()
+            service = self.service_factory.get_service()
+            batch = service.new_batch_http_request(callback=callback)
+
+            for folder_id in folder_ids:
+                self.rate_limiter.acquire()
+                batch.add(
+                    service.files().get(fileId=folder_id, fields="name, parents"),
+                    request_id=folder_id,
+                )
 
-            file = service.files().get(fileId=folder_id, fields="name").execute()
-            return file.get("name", "")
+            batch.execute()
         except Exception as e:
-            logger.warning(f"Failed to fetch folder name for {folder_id}: {e}")
-            return ""
+            logger.warning(f"Failed to prefetch folders: {e}")
 
-    @exponential_backoff()
-    def _fetch_parent_id(self, folder_id: str) -> Optional[str]:
-        """Fetch parent folder ID.
+    def _fetch_folder(self, folder_id: str) -> Optional[tuple[str, Optional[str]]]:
+        """Fetch folder name and parent folder ID in a single request.
+
+        Rate limit (429) and server (5xx) errors are retried with backoff.
 
         Args:
             folder_id: Folder ID
 
         Returns:
-            Parent folder ID or None
+            Tuple of (folder name, parent folder ID or None), or None if the
+            lookup failed
         """
         try:
-            service = self.service_factory.create_service()
-            self.rate_limiter.acquire()
-
-            file = service.files().get(fileId=folder_id, fields="parents").execute()
-            parents = file.get("parents", [])
-            return parents[0] if parents else None
+            file = self._get_folder(folder_id)
         except Exception as e:
-            logger.debug(f"Failed to fetch parent for {folder_id}: {e}")
+            logger.warning(f"Failed to fetch folder {folder_id}: {e}")
             return None
 
+        parents = file.get("parents", [])
+        return file.get("name", ""), parents[0] if parents else None
+
+    @exponential_backoff()
+    def _get_folder(self, folder_id: str) -> dict[str, Any]:
+        """Get a folder's name and parents, letting HttpError reach the retry decorator.
+
+        Args:
+            folder_id: Folder ID
+
+        Returns:
+            Drive API files.get response
+        """
+        service = self.service_factory.get_service()
+        self.rate_limiter.acquire()
+
+        response: dict[str, Any] = (
+            service.files().get(fileId=folder_id, fields="name, parents").execute()
+        )
+        return response
+
     def _parse_file(self, file_data: dict[str, Any]) -> FileRecord:
         """Parse file data from API response.
 
@@ -220,12 +336,8 @@ class DriveScanner:
             size=int(file_data.get("size", 0)),
             md5=file_data.get("md5Checksum"),
             mime_type=file_data.get("mimeType", ""),
-            created_time=datetime.fromisoformat(
-                file_data["createdTime"].replace("Z", "+00:00")
-            ),
-            modified_time=datetime.fromisoformat(
-                file_data["modifiedTime"].replace("Z", "+00:00")
-            ),
+            created_time=_parse_timestamp(file_data["createdTime"]),
+            modified_time=_parse_timestamp(file_data["modifiedTime"]),
             path=path,
             trashed=file_data.get("trashed", False),
             owned_by_me=file_data.get("ownedByMe", True),
@@ -1,15 +1,92 @@
 """SQLite-backed file index."""
 
 import sqlite3
-from datetime import datetime
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterator, Optional
 
+import orjson
+
 from ..common.logging import get_logger
 from ..detector.models import DuplicateGroup, FileRecord
 
 logger = get_logger(__name__)
 
+# Secondary indexes on the files table; dropped and rebuilt around bulk loads.
+# The partial indexes cover the duplicate queries, which only look at
+# untrashed files with an MD5, so those run as index-only scans. trashed is
+# repeated as a trailing column because older SQLite versions don't treat
+# columns constrained by the index WHERE clause as covered.
+_FILE_INDEXES = {
+    "idx_dedup": (
+        "CREATE INDEX IF NOT EXISTS idx_dedup ON files(size, md5, file_id, trashed) "
+        "WHERE trashed = 0 AND md5 IS NOT NULL"
+    ),
+    "idx_md5_nontrash": (
+        "CREATE INDEX IF NOT EXISTS idx_md5_nontrash ON files(md5, file_id, trashed) "
+        "WHERE trashed = 0 AND md5 IS NOT NULL"
+    ),
+}
+
+# Indexes from earlier schema versions, superseded by the ones above
+_LEGACY_INDEXES = ("idx_size", "idx_md5", "idx_trashed")
+
+_CREATE_FILES_TABLE = """
+    CREATE TABLE IF NOT EXISTS files (
+        file_id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        md5 TEXT,
+        mime_type TEXT NOT NULL,
+        created_time INTEGER NOT NULL,
+        modified_time INTEGER NOT NULL,
+        path TEXT NOT NULL,
+        trashed INTEGER NOT NULL DEFAULT 0,
+        owned_by_me INTEGER NOT NULL DEFAULT 1
+    )
+"""
+
+
+# Longest key list bound inline as IN (?, ...); longer lists go through a
+# temporary table to stay under SQLite's bound-parameter limit
+_MAX_INLINE_KEYS = 500
+
+# Columns read back into FileRecord, selected by name rather than SELECT *
+_FILE_COLUMNS = (
+    "file_id, name, size, md5, mime_type, created_time, modified_time, "
+    "path, trashed, owned_by_me"
+)
+
+
+_INSERT_FILE_SQL = f"INSERT OR REPLACE INTO files ({_FILE_COLUMNS}) VALUES ({','.join('?' * 10)})"
+
+# Rows staged by add_file() before they are written in one executemany call
+_PENDING_FLUSH_SIZE = 1000
+
+
+def _to_timestamp(value: datetime) -> int:
+    """Convert a datetime to Unix epoch seconds, treating naive values as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+def _file_params(file: FileRecord) -> tuple:
+    """Convert a FileRecord to parameters for _INSERT_FILE_SQL."""
+    return (
+        file.file_id,
+        file.name,
+        file.size,
+        file.md5,
+        file.mime_type,
+        _to_timestamp(file.created_time),
+        _to_timestamp(file.modified_time),
+        file.path,
+        1 if file.trashed else 0,
+        1 if file.owned_by_me else 0,
+    )
+
 
 class FileIndex:
     """SQLite database for storing file metadata."""
@@ -22,59 +99,121 @@ class FileIndex:
         """
         self.db_path = db_path
         self.conn: Optional[sqlite3.Connection] = None
+        self._pending: list[FileRecord] = []
         self._create_schema()
 
     def _create_schema(self) -> None:
         """Create database schema if it doesn't exist."""
         self.conn = sqlite3.connect(str(self.db_path))
-        self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS files (
-                file_id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                size INTEGER NOT NULL,
-                md5 TEXT,
-                mime_type TEXT NOT NULL,
-                created_time TEXT NOT NULL,
-                modified_time TEXT NOT NULL,
-                path TEXT NOT NULL,
-                trashed INTEGER NOT NULL DEFAULT 0,
-                owned_by_me INTEGER NOT NULL DEFAULT 1
-            )
-        """)
-        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_size ON files(size)")
-        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_md5 ON files(md5)")
-        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_trashed ON files(trashed)")
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        self.conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+        self._migrate_timestamps()
+        self.conn.execute(_CREATE_FILES_TABLE)
+        for name in _LEGACY_INDEXES:
+            self.conn.execute(f"DROP INDEX IF EXISTS {name}")
+        self._create_indexes()
         self.conn.commit()
         logger.debug(f"Initialized file index at {self.db_path}")
 
+    def _migrate_timestamps(self) -> None:
+        """Convert a files table with ISO 8601 text timestamps to epoch integers.
+
+        The columns must change type (not just value) so SQLite stops applying
+        TEXT affinity, which means rebuilding the table. The rebuild runs in a
+        single transaction.
+        """
+        if not self.conn:
+            raise RuntimeError("Database connection not initialized")
+
+        column_types = {
+            row[1]: row[2] for row in self.conn.execute("PRAGMA table_info(files)")
+        }
+        if column_types.get("created_time") != "TEXT":
+            return
+
+        logger.info("Migrating file index timestamps to integers")
+        # DDL would otherwise autocommit statement by statement
+        self.conn.execute("BEGIN")
+        try:
+            self.conn.execute("ALTER TABLE files RENAME TO files_old")
+            self.conn.execute(_CREATE_FILES_TABLE)
+            self.conn.execute("""
+                INSERT INTO files
+                SELECT file_id, name, size, md5, mime_type,
+                    CAST(strftime('%s', created_time) AS INTEGER),
+                    CAST(strftime('%s', modified_time) AS INTEGER),
+                    path, trashed, owned_by_me
+                FROM files_old
+            """)
+            self.conn.execute("DROP TABLE files_old")
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            raise
+
+    def _create_indexes(self) -> None:
+        """Create secondary indexes on the files table if missing."""
+        if not self.conn:
+            raise RuntimeError("Database connection not initialized")
+
+        for statement in _FILE_INDEXES.values():
+            self.conn.execute(statement)
+
+    @contextmanager
+    def bulk_load(self) -> Iterator[None]:
+        """Drop secondary indexes for the duration of a bulk insert.
+
+        Inserting into an unindexed table and rebuilding the indexes once at
+        the end is much faster than maintaining them row by row. Pending
+        writes are committed, the indexes recreated and planner statistics
+        refreshed on exit.
+        """
+        if not self.conn:
+            raise RuntimeError("Database connection not initialized")
+
+        for name in _FILE_INDEXES:
+            self.conn.execute(f"DROP INDEX IF EXISTS {name}")
+        try:
+            yield
+        finally:
+            if self.conn:
+                self._flush_pending()
+                self._create_indexes()
+                self.conn.execute("ANALYZE files")
+                self.conn.commit()
+
+    def commit(self) -> None:
+        """Commit pending writes.
+
+        add_file() and add_files() do not commit on their own, so bulk loads
+        can run in a few large transactions.
+        """
+        if not self.conn:
+            raise RuntimeError("Database connection not initialized")
+
+        self._flush_pending()
+        self.conn.commit()
+
     def add_file(self, file: FileRecord) -> None:
         """Add or update a file in the index.
 
+        The row is staged and written together with others via executemany
+        once _PENDING_FLUSH_SIZE rows are queued, or before the next read,
+        add_files() or commit().
+
         Args:
             file: File record to add
         """
         if not self.conn:
             raise RuntimeError("Database connection not initialized")
 
-        self.conn.execute(
-            """
-            INSERT OR REPLACE INTO files
-            (file_id, name, size, md5, mime_type, created_time, modified_time, path, trashed, owned_by_me)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                file.file_id,
-                file.name,
-                file.size,
-                file.md5,
-                file.mime_type,
-                file.created_time.isoformat(),
-                file.modified_time.isoformat(),
-                file.path,
-                1 if file.trashed else 0,
-                1 if file.owned_by_me else 0,
-            ),
-        )
+        self._pending.append(file)
+        if len(self._pending) >= _PENDING_FLUSH_SIZE:
+            self._flush_pending()
 
     def add_files(self, files: list[FileRecord]) -> None:
         """Add multiple files in a batch.
@@ -85,29 +224,14 @@ class FileIndex:
         if not self.conn:
             raise RuntimeError("Database connection not initialized")
 
-        self.conn.executemany(
-            """
-            INSERT OR REPLACE INTO files
-            (file_id, name, size, md5, mime_type, created_time, modified_time, path, trashed, owned_by_me)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            [
-                (
-                    f.file_id,
-                    f.name,
-                    f.size,
-                    f.md5,
-                    f.mime_type,
-                    f.created_time.isoformat(),
-                    f.modified_time.isoformat(),
-                    f.path,
-                    1 if f.trashed else 0,
-                    1 if f.owned_by_me else 0,
-                )
-                for f in files
-            ],
-        )
-        self.conn.commit()
+        self._flush_pending()
+        self.conn.executemany(_INSERT_FILE_SQL, map(_file_params, files))
+
+    def _flush_pending(self) -> None:
+        """Write rows staged by add_file()."""
+        if self._pending and self.conn:
+            pending, self._pending = self._pending, []
+            self.conn.executemany(_INSERT_FILE_SQL, map(_file_params, pending))
 
     def get_file(self, file_id: str) -> Optional[FileRecord]:
         """Get a file by ID.
@@ -121,8 +245,10 @@ class FileIndex:
         if not self.conn:
             raise RuntimeError("Database connection not initialized")
 
+        self._flush_pending()
+
         cursor = self.conn.execute(
-            "SELECT * FROM files WHERE file_id = ?",
+            f"SELECT {_FILE_COLUMNS} FROM files WHERE file_id = ?",
             (file_id,),
         )
         row = cursor.fetchone()
@@ -137,6 +263,8 @@ class FileIndex:
         if not self.conn:
             raise RuntimeError("Database connection not initialized")
 
+        self._flush_pending()
+
         cursor = self.conn.execute("SELECT COUNT(*) FROM files WHERE trashed = 0")
         return cursor.fetchone()[0]
 
@@ -152,9 +280,11 @@ class FileIndex:
         if not self.conn:
             raise RuntimeError("Database connection not initialized")
 
+        self._flush_pending()
+
         cursor = self.conn.execute(
             """
-            SELECT size, GROUP_CONCAT(file_id) as ids
+            SELECT size, json_group_array(file_id) as ids
             FROM files
             WHERE trashed = 0 AND size >= ? AND md5 IS NOT NULL
             GROUP BY size
@@ -166,7 +296,7 @@ class FileIndex:
         result: dict[int, list[str]] = {}
         for row in cursor:
             size, ids = row
-            result[size] = ids.split(",")
+            result[size] = orjson.loads(ids)
         return result
 
     def find_by_md5(self, md5_list: list[str]) -> dict[str, list[str]]:
@@ -181,23 +311,25 @@ class FileIndex:
         if not self.conn:
             raise RuntimeError("Database connection not initialized")
 
-        placeholders = ",".join("?" * len(md5_list))
+        self._flush_pending()
+
+        md5_filter, params = self._key_filter("md5", md5_list)
         cursor = self.conn.execute(
             f"""
-            SELECT md5, GROUP_CONCAT(file_id) as ids
+            SELECT md5, json_group_array(file_id) as ids
             FROM files
-            WHERE trashed = 0 AND md5 IN ({placeholders})
+            WHERE trashed = 0 AND md5 IS NOT NULL AND {md5_filter}
             GROUP BY md5
             HAVING COUNT(*) > 1
             """,
-            md5_list,
+            params,
         )
 
         result: dict[str, list[str]] = {}
         for row in cursor:
             md5, ids = row
             if md5:
-                result[md5] = ids.split(",")
+                result[md5] = orjson.loads(ids)
         return result
 
     def get_files_by_ids(self, file_ids: list[str]) -> list[FileRecord]:
@@ -212,13 +344,15 @@ class FileIndex:
         if not self.conn:
             raise RuntimeError("Database connection not initialized")
 
+        self._flush_pending()
+
         if not file_ids:
             return []
 
-        placeholders = ",".join("?" * len(file_ids))
+        id_filter, params = self._key_filter("file_id", file_ids)
         cursor = self.conn.execute(
-            f"SELECT * FROM files WHERE file_id IN ({placeholders})",
-            file_ids,
+            f"SELECT {_FILE_COLUMNS} FROM files WHERE {id_filter}",
+            params,
         )
 
         return [self._row_to_file(row) for row in cursor]
@@ -228,36 +362,66 @@ class FileIndex:
         if not self.conn:
             raise RuntimeError("Database connection not initialized")
 
+        self._pending.clear()
         self.conn.execute("DELETE FROM files")
         self.conn.commit()
         logger.info("Cleared file index")
 
     def close(self) -> None:
-        """Close database connection."""
+        """Commit pending writes and close database connection."""
         if self.conn:
+            self._flush_pending()
+            self.conn.commit()
             self.conn.close()
             self.conn = None
 
-    def _row_to_file(self, row: tuple) -> FileRecord:
+    def _key_filter(self, column: str, keys: list[str]) -> tuple[str, list[str]]:
+        """Build a WHERE clause restricting column to a list of keys.
+
+        Short lists are bound inline; long ones are loaded into a temporary
+        probe table, which avoids the bound-parameter limit and a huge IN list.
+
+        Args:
+            column: Column to filter on
+            keys: Values the column must match
+
+        Returns:
+            Tuple of (SQL condition, parameters to bind)
+        """
+        if not self.conn:
+            raise RuntimeError("Database connection not initialized")
+
+        if len(keys) <= _MAX_INLINE_KEYS:
+            return f"{column} IN ({','.join('?' * len(keys))})", keys
+
+        self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS probe (k TEXT PRIMARY KEY)")
+        self.conn.execute("DELETE FROM probe")
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO probe (k) VALUES (?)",
+            ((key,) for key in keys),
+        )
+        return f"{column} IN (SELECT k FROM probe)", []
+
+    def _row_to_file(self, row: sqlite3.Row) -> FileRecord:
         """Convert database row to FileRecord.
 
         Args:
-            row: Database row tuple
+            row: Database row with the _FILE_COLUMNS columns
 
         Returns:
             FileRecord instance
         """
         return FileRecord(
-            file_id=row[0],
-            name=row[1],
-            size=row[2],
-            md5=row[3],
-            mime_type=row[4],
-            created_time=datetime.fromisoformat(row[5]),
-            modified_time=datetime.fromisoformat(row[6]),
-            path=row[7],
-            trashed=bool(row[8]),
-            owned_by_me=bool(row[9]),
+            file_id=row["file_id"],
+            name=row["name"],
+            size=row["size"],
+            md5=row["md5"],
+            mime_type=row["mime_type"],
+            created_time=datetime.fromtimestamp(row["created_time"], tz=timezone.utc),
+            modified_time=datetime.fromtimestamp(row["modified_time"], tz=timezone.utc),
+            path=row["path"],
+            trashed=bool(row["trashed"]),
+            owned_by_me=bool(row["owned_by_me"]),
         )
 
     def __enter__(self) -> "FileIndex":
@@ -1,31 +1,157 @@
 """Scan checkpoint/resume functionality."""
 
-import json
+import atexit
+import os
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from queue import Empty, Queue
+from threading import Thread
+from typing import Any, Optional
 
+import orjson
+
+from ..common.constants import CHECKPOINT_INTERVAL_FILES, CHECKPOINT_INTERVAL_SECONDS
 from ..common.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Version of the checkpoint layout written by ScanCheckpoint. Version 1 stored
+# last_update as an ISO 8601 string; version 2 stores epoch seconds.
+CHECKPOINT_FORMAT_VERSION = 2
+
+
+@lru_cache(maxsize=128)
+def _parse_iso(value: str) -> datetime:
+    """Parse a version 1 ISO 8601 timestamp, memoized since checkpoints are reloaded."""
+    return datetime.fromisoformat(value)
+
+
+# Queued by CheckpointWriter.close() to stop the writer thread
+_SENTINEL = object()
+
+
+class CheckpointWriter:
+    """Persists checkpoints on a background thread.
+
+    Only the latest checkpoint matters, so the queue holds a single item and
+    a new checkpoint replaces one that hasn't been written yet.
+    """
+
+    def __init__(self, checkpoint_path: Path) -> None:
+        """Start the writer thread.
+
+        Args:
+            checkpoint_path: Path to checkpoint file
+
+        Raises:
+            OSError: If the checkpoint directory can't be created
+        """
+        self.checkpoint_path = checkpoint_path
+        # Created here rather than on the thread so failures reach the caller
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        self._queue: Queue[Any] = Queue(maxsize=1)
+        self._thread = Thread(target=self._run, name="checkpoint-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, checkpoint_data: dict[str, Any]) -> None:
+        """Queue a checkpoint for writing, dropping any stale queued one.
+
+        Must only be called from one thread.
+
+        Args:
+            checkpoint_data: JSON-serializable checkpoint state
+        """
+        try:
+            self._queue.get_nowait()
+        except Empty:
+            pass
+        self._queue.put_nowait(checkpoint_data)
+
+    def close(self) -> None:
+        """Write any queued checkpoint and stop the writer thread."""
+        # A dead thread would never drain the queue, so don't block on it
+        if not self._thread.is_alive():
+            return
+        self._queue.put(_SENTINEL)
+        self._thread.join()
+
+    def _run(self) -> None:
+        """Write queued checkpoints until the sentinel arrives."""
+        while True:
+            item = self._queue.get()
+            if item is _SENTINEL:
+                return
+            try:
+                self._write(item)
+            except Exception as e:
+                logger.warning(f"Failed to write checkpoint: {e}")
+
+    def _write(self, checkpoint_data: dict[str, Any]) -> None:
+        """Atomically replace the checkpoint file.
+
+        The data goes to a temporary file that is synced and then renamed over
+        the checkpoint, so a crash mid-write never leaves a truncated file.
+        This runs off the scan loop, so the fsync doesn't slow the scan down.
+
+        Args:
+            checkpoint_data: JSON-serializable checkpoint state
+        """
+        tmp_path = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+        # Serialize first so the file is written in one call; the checkpoint
+        # is only read back by load(), so it isn't indented
+        payload = memoryview(orjson.dumps(checkpoint_data))
+
+        # The payload is tiny, so write to the raw descriptor rather than
+        # going through a buffered file object
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while payload:
+                payload = payload[os.write(fd, payload):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, self.checkpoint_path)
+
 
 class ScanCheckpoint:
     """Manages scan state for resume functionality."""
 
-    def __init__(self, checkpoint_path: Path) -> None:
+    def __init__(
+        self,
+        checkpoint_path: Path,
+        min_files: int = CHECKPOINT_INTERVAL_FILES,
+        min_interval: float = CHECKPOINT_INTERVAL_SECONDS,
+    ) -> None:
         """Initialize checkpoint manager.
 
         Args:
             checkpoint_path: Path to checkpoint file
+            min_files: Files scanned since the last write before writing again
+            min_interval: Seconds since the last write before writing again
         """
         self.checkpoint_path = checkpoint_path
+        self.min_files = min_files
+        self.min_interval = min_interval
         self.page_token: Optional[str] = None
         self.files_scanned: int = 0
-        self.last_update: Optional[datetime] = None
+        self._last_update_ts: Optional[float] = None
+        self._writer: Optional[CheckpointWriter] = None
+        self._dirty = False
+        self._last_persisted_count = 0
+        self._last_persist_mono = time.monotonic()
+
+        # Persist whatever is still in memory on a clean interpreter exit
+        atexit.register(self.close)
+
+    def update(self, page_token: Optional[str], files_scanned: int) -> None:
+        """Update checkpoint state.
 
-    def save(self, page_token: Optional[str], files_scanned: int) -> None:
-        """Save checkpoint state.
+        The in-memory state is authoritative; it is written to disk once
+        min_files more files have been scanned or min_interval seconds have
+        passed since the last write. Writes happen on a background thread;
+        call flush() or close() to make sure the latest state is on disk.
 
         Args:
             page_token: Current API page token
@@ -33,39 +159,82 @@ class ScanCheckpoint:
         """
         self.page_token = page_token
         self.files_scanned = files_scanned
-        self.last_update = datetime.now()
+        self._last_update_ts = time.time()
+        self._dirty = True
+        self._maybe_flush()
 
-        checkpoint_data = {
+    def _maybe_flush(self) -> None:
+        """Write the current state if either write threshold has been crossed."""
+        if (
+            self.files_scanned - self._last_persisted_count >= self.min_files
+            or time.monotonic() - self._last_persist_mono >= self.min_interval
+        ):
+            self._persist()
+
+    @property
+    def last_update(self) -> Optional[datetime]:
+        """Local time of the last update, or None if nothing was updated or loaded.
+
+        Stored as epoch seconds and only converted to a datetime when read.
+        """
+        if self._last_update_ts is None:
+            return None
+        return datetime.fromtimestamp(self._last_update_ts)
+
+    def flush(self) -> None:
+        """Write the current state if it changed since the last write."""
+        if self._dirty:
+            self._persist()
+
+    def close(self) -> None:
+        """Flush the current state and stop the writer thread."""
+        atexit.unregister(self.close)
+        try:
+            self.flush()
+        finally:
+            self._stop_writer()
+
+    def _persist(self) -> None:
+        """Hand the current state to the writer thread."""
+        if self._writer is None:
+            self._writer = CheckpointWriter(self.checkpoint_path)
+
+        self._writer.submit({
+            "format_version": CHECKPOINT_FORMAT_VERSION,
             "page_token": self.page_token,
             "files_scanned": self.files_scanned,
-            "last_update": self.last_update.isoformat(),
-        }
-
-        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.checkpoint_path, "w") as f:
-            json.dump(checkpoint_data, f, indent=2)
+            "last_update": self._last_update_ts,
+        })
 
+        self._dirty = False
+        self._last_persisted_count = self.files_scanned
+        self._last_persist_mono = time.monotonic()
         logger.debug(f"Saved checkpoint: {self.files_scanned} files")
 
+    def _stop_writer(self) -> None:
+        """Wait for queued writes and stop the writer thread."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
     def load(self) -> bool:
         """Load checkpoint state.
 
         Returns:
             True if checkpoint was loaded, False if no checkpoint exists
         """
-        if not self.checkpoint_path.exists():
-            return False
-
         try:
-            with open(self.checkpoint_path, "r") as f:
-                checkpoint_data = json.load(f)
+            checkpoint_data = orjson.loads(self.checkpoint_path.read_bytes())
 
             self.page_token = checkpoint_data.get("page_token")
             self.files_scanned = checkpoint_data.get("files_scanned", 0)
 
-            last_update_str = checkpoint_data.get("last_update")
-            if last_update_str:
-                self.last_update = datetime.fromisoformat(last_update_str)
+            last_update = checkpoint_data.get("last_update")
+            if last_update is not None:
+                if checkpoint_data.get("format_version", 1) >= 2:
+                    self._last_update_ts = last_update
+                else:
+                    self._last_update_ts = _parse_iso(last_update).timestamp()
 
             logger.info(
                 f"Loaded checkpoint: {self.files_scanned} files, "
@@ -73,16 +242,22 @@ class ScanCheckpoint:
             )
             return True
 
+        except FileNotFoundError:
+            return False
         except Exception as e:
             logger.warning(f"Failed to load checkpoint: {e}")
             return False
 
     def clear(self) -> None:
         """Clear checkpoint file."""
-        if self.checkpoint_path.exists():
-            self.checkpoint_path.unlink()
-            logger.debug("Cleared checkpoint")
+        # Stop the writer first so a queued write can't recreate the file;
+        # unsaved state is discarded rather than flushed
+        self._stop_writer()
+        self._dirty = False
+
+        self.checkpoint_path.unlink(missing_ok=True)
+        logger.debug("Cleared checkpoint")
 
         self.page_token = None
         self.files_scanned = 0
-        self.last_update = None
+        self._last_update_ts = None
@@ -2,14 +2,43 @@
 
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Callable
 from unittest.mock import Mock
 
 import pytest
+from googleapiclient.errors import HttpError
 
 from gdrive_dedup.detector.models import FileRecord
 
+# Noon on each day of January 2024, shared by fixtures and tests
+_DATES = tuple(datetime(2024, 1, day, 12, 0, 0) for day in range(1, 32))
 
-@pytest.fixture
+# Built once at import; FileRecord is frozen, so tests derive variants
+# with dataclasses.replace
+_SAMPLE_FILES_TEMPLATE = tuple(
+    FileRecord(
+        file_id=f"file{i}",
+        name=f"test{i}.txt",
+        size=1024,
+        md5="abc123",
+        mime_type="text/plain",
+        created_time=_DATES[i - 1],
+        modified_time=_DATES[i - 1],
+        path=f"/folder{i}/test{i}.txt",
+        trashed=False,
+        owned_by_me=True,
+    )
+    for i in range(1, 4)
+)
+
+
+@pytest.fixture(scope="session")
+def dates() -> tuple[datetime, ...]:
+    """Noon timestamps for January 2024, indexed from day 1 at position 0."""
+    return _DATES
+
+
+@pytest.fixture(scope="session")
 def sample_file() -> FileRecord:
     """Create a sample file record."""
     return FileRecord(
@@ -18,8 +47,8 @@ def sample_file() -> FileRecord:
         size=1024,
         md5="abc123",
         mime_type="text/plain",
-        created_time=datetime(2024, 1, 1, 12, 0, 0),
-        modified_time=datetime(2024, 1, 1, 12, 0, 0),
+        created_time=_DATES[0],
+        modified_time=_DATES[0],
         path="/folder/test.txt",
         trashed=False,
         owned_by_me=True,
@@ -28,33 +57,96 @@ def sample_file() -> FileRecord:
 
 @pytest.fixture
 def sample_files() -> list[FileRecord]:
-    """Create multiple sample file records."""
-    return [
-        FileRecord(
-            file_id=f"file{i}",
-            name=f"test{i}.txt",
-            size=1024,
-            md5="abc123",
-            mime_type="text/plain",
-            created_time=datetime(2024, 1, i, 12, 0, 0),
-            modified_time=datetime(2024, 1, i, 12, 0, 0),
-            path=f"/folder{i}/test{i}.txt",
-            trashed=False,
-            owned_by_me=True,
-        )
-        for i in range(1, 4)
-    ]
+    """Create multiple sample file records.
 
+    Function-scoped so each test gets its own list to mutate.
+    """
+    return list(_SAMPLE_FILES_TEMPLATE)
 
-@pytest.fixture
-def mock_drive_service() -> Mock:
-    """Create a mock Drive API service."""
+
+@pytest.fixture(scope="session")
+def _drive_service_template() -> Mock:
+    """Build the mock Drive API service once per session."""
     service = Mock()
     files_resource = Mock()
     service.files.return_value = files_resource
     return service
 
 
+@pytest.fixture
+def mock_drive_service(_drive_service_template: Mock) -> Mock:
+    """Create a mock Drive API service.
+
+    The session-wide mock is reset before each test, including any return
+    values and side effects configured by earlier tests.
+    """
+    service = _drive_service_template
+    files_resource = service.files.return_value
+    # Reset files() separately; resetting return values on the service
+    # detaches it from service.files without touching its children
+    files_resource.reset_mock(return_value=True, side_effect=True)
+    service.reset_mock(return_value=True, side_effect=True)
+    service.files.return_value = files_resource
+    return service
+
+
+@pytest.fixture
+def service_factory(mock_drive_service: Mock) -> Mock:
+    """Create a DriveServiceFactory stand-in that returns mock_drive_service."""
+    factory = Mock()
+    factory.get_service.return_value = mock_drive_service
+    return factory
+
+
+class FakeBatch:
+    """Minimal stand-in for BatchHttpRequest that executes requests in order.
+
+    Request IDs listed in errors fail with an HttpError of that status
+    instead of being executed.
+    """
+
+    def __init__(self, callback: Callable[..., None], errors: dict[str, int]) -> None:
+        self.callback = callback
+        self.errors = errors
+        self.requests: list[tuple[str, Any]] = []
+
+    @property
+    def request_ids(self) -> list[str]:
+        """IDs of the requests added to this batch, in order."""
+        return [request_id for request_id, _ in self.requests]
+
+    def add(self, request: Any, request_id: str) -> None:
+        self.requests.append((request_id, request))
+
+    def execute(self) -> None:
+        for request_id, request in self.requests:
+            status = self.errors.get(request_id)
+            if status is None:
+                self.callback(request_id, request.execute(), None)
+            else:
+                self.callback(request_id, None, HttpError(Mock(status=status), b""))
+
+
+@pytest.fixture
+def batch_errors() -> dict[str, int]:
+    """HTTP status per request ID for FakeBatch sub-requests that should fail."""
+    return {}
+
+
+@pytest.fixture
+def fake_batches(mock_drive_service: Mock, batch_errors: dict[str, int]) -> list[FakeBatch]:
+    """Serve FakeBatch from mock_drive_service and record every batch created."""
+    batches: list[FakeBatch] = []
+
+    def new_batch(callback: Callable[..., None]) -> FakeBatch:
+        batch = FakeBatch(callback, batch_errors)
+        batches.append(batch)
+        return batch
+
+    mock_drive_service.new_batch_http_request.side_effect = new_batch
+    return batches
+
+
 @pytest.fixture
 def temp_db(tmp_path: Path) -> Path:
     """Create a temporary database path."""
@@ -1,8 +1,12 @@
 """Tests for deletion strategies."""
 
+from dataclasses import replace
 from datetime import datetime
 
+import pytest
+
 from gdrive_dedup.actions.strategies import (
+    DeletionStrategy,
     KeepNewestStrategy,
     KeepOldestStrategy,
     KeepShortestPathStrategy,
@@ -10,104 +14,61 @@ from gdrive_dedup.actions.strategies import (
 )
 from gdrive_dedup.detector.models import DuplicateGroup, FileRecord
 
+_BASE_FILES = (
+    FileRecord(
+        file_id="file1",
+        name="test.txt",
+        size=1024,
+        md5="abc123",
+        mime_type="text/plain",
+        created_time=datetime(2024, 1, 1),
+        modified_time=datetime(2024, 1, 1),
+        path="/test1.txt",
+    ),
+    FileRecord(
+        file_id="file2",
+        name="test.txt",
+        size=1024,
+        md5="abc123",
+        mime_type="text/plain",
+        created_time=datetime(2024, 1, 1),
+        modified_time=datetime(2024, 1, 5),
+        path="/test2.txt",
+    ),
+)
 
-def test_keep_newest_strategy() -> None:
-    """Test keep newest strategy."""
-    files = [
-        FileRecord(
-            file_id="file1",
-            name="test.txt",
-            size=1024,
-            md5="abc123",
-            mime_type="text/plain",
-            created_time=datetime(2024, 1, 1),
-            modified_time=datetime(2024, 1, 1),
-            path="/test1.txt",
-        ),
-        FileRecord(
-            file_id="file2",
-            name="test.txt",
-            size=1024,
-            md5="abc123",
-            mime_type="text/plain",
-            created_time=datetime(2024, 1, 1),
-            modified_time=datetime(2024, 1, 5),
-            path="/test2.txt",
-        ),
-    ]
-
-    group = DuplicateGroup(group_id=1, files=files, size=1024, md5="abc123")
-    strategy = KeepNewestStrategy()
-    to_trash = strategy.select_files_to_trash(group)
-
-    assert len(to_trash) == 1
-    assert to_trash[0].file_id == "file1"
-
-
-def test_keep_oldest_strategy() -> None:
-    """Test keep oldest strategy."""
-    files = [
-        FileRecord(
-            file_id="file1",
-            name="test.txt",
-            size=1024,
-            md5="abc123",
-            mime_type="text/plain",
-            created_time=datetime(2024, 1, 1),
-            modified_time=datetime(2024, 1, 1),
-            path="/test1.txt",
-        ),
-        FileRecord(
-            file_id="file2",
-            name="test.txt",
-            size=1024,
-            md5="abc123",
-            mime_type="text/plain",
-            created_time=datetime(2024, 1, 1),
-            modified_time=datetime(2024, 1, 5),
-            path="/test2.txt",
-        ),
-    ]
+# file1 is older than file2, but has the longer path in the shortest-path case
+_SHORTEST_PATH_FILES = (
+    replace(_BASE_FILES[0], path="/very/long/path/to/file/test1.txt"),
+    replace(_BASE_FILES[1], modified_time=datetime(2024, 1, 1)),
+)
 
-    group = DuplicateGroup(group_id=1, files=files, size=1024, md5="abc123")
-    strategy = KeepOldestStrategy()
-    to_trash = strategy.select_files_to_trash(group)
 
-    assert len(to_trash) == 1
-    assert to_trash[0].file_id == "file2"
+@pytest.fixture(
+    params=[
+        (KeepNewestStrategy, _BASE_FILES, "file1"),
+        (KeepOldestStrategy, _BASE_FILES, "file2"),
+        (KeepShortestPathStrategy, _SHORTEST_PATH_FILES, "file1"),
+    ],
+    ids=["newest", "oldest", "shortest"],
+)
+def strategy_case(request: pytest.FixtureRequest) -> tuple[DeletionStrategy, DuplicateGroup, str]:
+    """Strategy, duplicate group, and the file ID it should trash."""
+    strategy_cls, files, expected_id = request.param
+    group = DuplicateGroup(group_id=1, files=list(files), size=1024, md5="abc123")
+    return strategy_cls(), group, expected_id
 
 
-def test_keep_shortest_path_strategy() -> None:
-    """Test keep shortest path strategy."""
-    files = [
-        FileRecord(
-            file_id="file1",
-            name="test.txt",
-            size=1024,
-            md5="abc123",
-            mime_type="text/plain",
-            created_time=datetime(2024, 1, 1),
-            modified_time=datetime(2024, 1, 1),
-            path="/very/long/path/to/file/test1.txt",
-        ),
-        FileRecord(
-            file_id="file2",
-            name="test.txt",
-            size=1024,
-            md5="abc123",
-            mime_type="text/plain",
-            created_time=datetime(2024, 1, 1),
-            modified_time=datetime(2024, 1, 1),
-            path="/test2.txt",
-        ),
-    ]
+def test_strategy_selects_file_to_trash(
+    strategy_case: tuple[DeletionStrategy, DuplicateGroup, str],
+) -> None:
+    """Test each strategy keeps one file and trashes the other."""
+    strategy, group, expected_id = strategy_case
 
-    group = DuplicateGroup(group_id=1, files=files, size=1024, md5="abc123")
-    strategy = KeepShortestPathStrategy()
     to_trash = strategy.select_files_to_trash(group)
 
     assert len(to_trash) == 1
-    assert to_trash[0].file_id == "file1"
+    assert to_trash[0].file_id == expected_id
 
 
 def test_get_strategy() -> None:
@@ -0,0 +1,69 @@
+"""Tests for trash operations."""
+
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from gdrive_dedup.actions.trash import TrashManager
+
+
+@pytest.fixture
+def manager(service_factory: Mock, fake_batches: list[Any]) -> TrashManager:
+    """Create a TrashManager whose service returns FakeBatch instances."""
+    return TrashManager(service_factory, Mock(), batch_size=2)
+
+
+def test_trash_files_uses_batches(
+    manager: TrashManager, mock_drive_service: Mock, fake_batches: list[Any]
+) -> None:
+    """Test that files are trashed in batches of batch_size."""
+    results = manager.trash_files(["a", "b", "c"])
+
+    assert results == {"a": True, "b": True, "c": True}
+    assert sorted(b.request_ids for b in fake_batches) == [["a", "b"], ["c"]]
+    for call in mock_drive_service.files().update.call_args_list:
+        assert call.kwargs["body"] == {"trashed": True}
+
+
+def test_trash_batch_handles_errors(
+    manager: TrashManager, mock_drive_service: Mock, batch_errors: dict[str, int]
+) -> None:
+    """Test 404s are reported and retryable errors fall back to single requests."""
+    batch_errors.update({"a": 404, "b": 503})
+
+    results = manager.trash_batch(["a", "b"])
+
+    assert results == {"a": False, "b": True}
+    # The 503 was retried through a single files().update(...).execute() call
+    mock_drive_service.files().update.return_value.execute.assert_called_once()
+
+
+def test_trash_batch_retries_rate_limited_requests(
+    manager: TrashManager, mock_drive_service: Mock, batch_errors: dict[str, int]
+) -> None:
+    """Test a throttled sub-request is retried with backoff until it succeeds."""
+    batch_errors["a"] = 429
+    execute = mock_drive_service.files().update.return_value.execute
+    execute.side_effect = [
+        HttpError(Mock(status=429), b""),
+        HttpError(Mock(status=429), b""),
+        {},
+    ]
+
+    with patch("gdrive_dedup.common.retry.time.sleep") as sleep:
+        results = manager.trash_batch(["a"])
+
+    assert results == {"a": True}
+    assert execute.call_count == 3
+    assert sleep.call_count == 2
+
+
+def test_trash_batch_dry_run(manager: TrashManager, mock_drive_service: Mock) -> None:
+    """Test dry run does not call the API."""
+
+    results = manager.trash_batch(["a", "b"], dry_run=True)
+
+    assert results == {"a": True, "b": True}
+    mock_drive_service.new_batch_http_request.assert_not_called()
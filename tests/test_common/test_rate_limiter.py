@@ -0,0 +1,50 @@
+"""Tests for the token bucket rate limiter."""
+
+import time
+from threading import Thread
+
+from gdrive_dedup.common.rate_limiter import TokenBucketRateLimiter
+
+
+def test_concurrent_throughput_matches_rate() -> None:
+    """Test many threads together acquire tokens at the configured rate."""
+    rate = 100.0
+    threads, per_thread = 6, 10
+    limiter = TokenBucketRateLimiter(rate, capacity=1)
+
+    def worker() -> None:
+        for _ in range(per_thread):
+            limiter.acquire()
+
+    workers = [Thread(target=worker) for _ in range(threads)]
+    start = time.monotonic()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join(timeout=10)
+    elapsed = time.monotonic() - start
+
+    assert not any(t.is_alive() for t in workers)
+    # One token is available up front; the rest arrive at `rate` per second
+    expected = (threads * per_thread - 1) / rate
+    assert expected * 0.9 <= elapsed < expected + 0.5
+
+
+def test_waiting_thread_does_not_block_others() -> None:
+    """Test a thread waiting for tokens doesn't hold the lock while it waits."""
+    limiter = TokenBucketRateLimiter(rate=1, capacity=1)
+    assert limiter.acquire()
+
+    # Needs about a second of refill, so it waits on the condition
+    waiter = Thread(target=limiter.acquire)
+    waiter.start()
+    time.sleep(0.05)
+
+    start = time.monotonic()
+    acquired = limiter.acquire(blocking=False)
+    elapsed = time.monotonic() - start
+
+    assert not acquired
+    assert elapsed < 0.1
+    waiter.join(timeout=5)
+    assert not waiter.is_alive()
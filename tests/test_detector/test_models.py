@@ -5,7 +5,7 @@ from datetime import datetime
 from gdrive_dedup.detector.models import DuplicateGroup, FileRecord
 
 
-def test_file_record_creation() -> None:
+def test_file_record_creation(dates: tuple[datetime, ...]) -> None:
     """Test creating a FileRecord."""
     file = FileRecord(
         file_id="test123",
@@ -13,8 +13,8 @@ def test_file_record_creation() -> None:
         size=1024,
         md5="abc123",
         mime_type="text/plain",
-        created_time=datetime(2024, 1, 1),
-        modified_time=datetime(2024, 1, 2),
+        created_time=dates[0],
+        modified_time=dates[1],
         path="/test.txt",
     )
 
@@ -24,7 +24,7 @@ def test_file_record_creation() -> None:
     assert file.md5 == "abc123"
 
 
-def test_duplicate_group_wasted_size() -> None:
+def test_duplicate_group_wasted_size(dates: tuple[datetime, ...]) -> None:
     """Test DuplicateGroup wasted size calculation."""
     files = [
         FileRecord(
@@ -33,8 +33,8 @@ def test_duplicate_group_wasted_size() -> None:
             size=1024,
             md5="abc123",
             mime_type="text/plain",
-            created_time=datetime(2024, 1, 1),
-            modified_time=datetime(2024, 1, i),
+            created_time=dates[0],
+            modified_time=dates[i - 1],
             path=f"/test{i}.txt",
         )
         for i in range(1, 4)
@@ -47,7 +47,7 @@ def test_duplicate_group_wasted_size() -> None:
     assert group.wasted_size == 2048  # 1024 * 2
 
 
-def test_duplicate_group_newest_file() -> None:
+def test_duplicate_group_newest_file(dates: tuple[datetime, ...]) -> None:
     """Test finding newest file in group."""
     files = [
         FileRecord(
@@ -56,8 +56,8 @@ def test_duplicate_group_newest_file() -> None:
             size=1024,
             md5="abc123",
             mime_type="text/plain",
-            created_time=datetime(2024, 1, 1),
-            modified_time=datetime(2024, 1, 1),
+            created_time=dates[0],
+            modified_time=dates[0],
             path="/test1.txt",
         ),
         FileRecord(
@@ -66,8 +66,8 @@ def test_duplicate_group_newest_file() -> None:
             size=1024,
             md5="abc123",
             mime_type="text/plain",
-            created_time=datetime(2024, 1, 1),
-            modified_time=datetime(2024, 1, 5),
+            created_time=dates[0],
+            modified_time=dates[4],
             path="/test2.txt",
         ),
     ]
@@ -76,4 +76,29 @@ def test_duplicate_group_newest_file() -> None:
     newest = group.newest_file()
 
     assert newest.file_id == "file2"
-    assert newest.modified_time == datetime(2024, 1, 5)
+    assert newest.modified_time == dates[4]
+
+
+def test_duplicate_group_same_folder(dates: tuple[datetime, ...]) -> None:
+    """Test checking whether all files in a group share a folder."""
+    def make_file(path: str) -> FileRecord:
+        return FileRecord(
+            file_id=path,
+            name=path.rpartition("/")[2],
+            size=1024,
+            md5="abc123",
+            mime_type="text/plain",
+            created_time=dates[0],
+            modified_time=dates[0],
+            path=path,
+        )
+
+    same = DuplicateGroup(
+        group_id=1, files=[make_file("/a/x.txt"), make_file("/a/y.txt")], size=1024
+    )
+    cross = DuplicateGroup(
+        group_id=2, files=[make_file("/a/x.txt"), make_file("/b/x.txt")], size=1024
+    )
+
+    assert same.are_all_in_same_folder()
+    assert not cross.are_all_in_same_folder()
@@ -0,0 +1,55 @@
+"""Tests for report export."""
+
+import csv
+import json
+from pathlib import Path
+
+from gdrive_dedup.detector.models import DuplicateGroup, FileRecord
+from gdrive_dedup.reporting.exporter import ReportExporter
+
+
+def test_export_json(tmp_path: Path, sample_files: list[FileRecord]) -> None:
+    """Test JSON export produces a valid report."""
+    groups = [
+        DuplicateGroup(group_id=1, files=sample_files, size=1024, md5="abc123"),
+        DuplicateGroup(group_id=2, files=sample_files[:2], size=1024, md5="abc123"),
+    ]
+    output = tmp_path / "report.json"
+
+    ReportExporter().export_json(groups, output)
+
+    data = json.loads(output.read_text())
+    assert data["total_groups"] == 2
+    assert data["total_files"] == 5
+    assert data["total_wasted_space"] == 3072
+    assert [g["group_id"] for g in data["groups"]] == [1, 2]
+    first = data["groups"][0]["files"][0]
+    assert first["file_id"] == "file1"
+    assert first["created_time"] == sample_files[0].created_time.isoformat()
+
+
+def test_export_json_empty(tmp_path: Path) -> None:
+    """Test JSON export with no groups."""
+    output = tmp_path / "report.json"
+
+    ReportExporter().export_json([], output)
+
+    assert json.loads(output.read_text()) == {
+        "total_groups": 0,
+        "total_files": 0,
+        "total_wasted_space": 0,
+        "groups": [],
+    }
+
+
+def test_export_csv(tmp_path: Path, sample_files: list[FileRecord]) -> None:
+    """Test CSV export writes one row per file."""
+    groups = [DuplicateGroup(group_id=1, files=sample_files, size=1024, md5="abc123")]
+    output = tmp_path / "report.csv"
+
+    ReportExporter().export_csv(groups, output)
+
+    with open(output, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["file_id"] for r in rows] == ["file1", "file2", "file3"]
+    assert rows[0]["modified_time"] == sample_files[0].modified_time.isoformat()
@@ -0,0 +1,155 @@
+"""Tests for Drive scanner path resolution."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from googleapiclient.errors import HttpError
+
+from gdrive_dedup.scanner.drive_scanner import DriveScanner
+
+FOLDERS = {
+    "root": {"name": "My Drive"},
+    "photos": {"name": "Photos", "parents": ["root"]},
+    "2024": {"name": "2024", "parents": ["photos"]},
+}
+
+
+@pytest.fixture
+def scanner(mock_drive_service: Mock, service_factory: Mock) -> DriveScanner:
+    """Create a scanner whose files().get() serves the FOLDERS tree."""
+    mock_drive_service.files().get.side_effect = lambda **kw: Mock(
+        execute=Mock(return_value=FOLDERS[kw["fileId"]])
+    )
+    return DriveScanner(service_factory, Mock())
+
+
+def test_get_file_path(scanner: DriveScanner) -> None:
+    """Test resolving a file's full path from its parent chain."""
+    assert scanner.get_file_path("file1", ["2024"]) == "/My Drive/Photos/2024"
+    assert scanner.get_file_path("file2", []) == "/"
+
+
+def test_get_file_path_fetches_each_folder_once(
+    scanner: DriveScanner, mock_drive_service: Mock
+) -> None:
+    """Test folder lookups are cached across files."""
+    scanner.get_file_path("file1", ["2024"])
+    scanner.get_file_path("file2", ["2024"])
+    scanner.get_file_path("file3", ["photos"])
+
+    assert mock_drive_service.files().get.call_count == len(FOLDERS)
+
+
+def test_get_file_path_caches_ancestor_paths(
+    scanner: DriveScanner, mock_drive_service: Mock
+) -> None:
+    """Test resolving a deep path makes its ancestors free to resolve."""
+    scanner.get_file_path("file1", ["2024"])
+    mock_drive_service.files().get.reset_mock()
+
+    assert scanner.get_file_path("file2", ["photos"]) == "/My Drive/Photos"
+    assert scanner.get_file_path("file3", ["root"]) == "/My Drive"
+    mock_drive_service.files().get.assert_not_called()
+
+
+def test_get_file_path_retries_rate_limited_lookups(
+    scanner: DriveScanner, mock_drive_service: Mock
+) -> None:
+    """Test throttled folder lookups are retried with backoff."""
+    serve_folder = mock_drive_service.files().get.side_effect
+    responses = iter([HttpError(Mock(status=429), b"")])
+
+    def get(**kw: str) -> Mock:
+        error = next(responses, None)
+        if error is not None:
+            return Mock(execute=Mock(side_effect=error))
+        return serve_folder(**kw)
+
+    mock_drive_service.files().get.side_effect = get
+
+    with patch("gdrive_dedup.common.retry.time.sleep") as sleep:
+        assert scanner.get_file_path("file1", ["2024"]) == "/My Drive/Photos/2024"
+
+    assert sleep.call_count == 1
+
+
+def test_get_file_path_retries_failed_lookups(
+    scanner: DriveScanner, mock_drive_service: Mock
+) -> None:
+    """Test a failed folder lookup is not cached and is retried for the next file."""
+    serve_folder = mock_drive_service.files().get.side_effect
+    failures = {"photos": HttpError(Mock(status=403), b"")}
+
+    def get(**kw: str) -> Mock:
+        error = failures.pop(kw["fileId"], None)
+        if error is not None:
+            return Mock(execute=Mock(side_effect=error))
+        return serve_folder(**kw)
+
+    mock_drive_service.files().get.side_effect = get
+
+    assert scanner.get_file_path("file1", ["2024"]) == "/2024"
+    assert scanner.get_file_path("file2", ["2024"]) == "/My Drive/Photos/2024"
+
+
+@pytest.mark.usefixtures("fake_batches")
+def test_scan_files_prefetches_folders(scanner: DriveScanner, mock_drive_service: Mock) -> None:
+    """Test scanning resolves folders with batch requests before parsing files."""
+    mock_drive_service.files().list.return_value.execute.return_value = {
+        "files": [
+            {
+                "id": f"file{i}",
+                "name": f"photo{i}.jpg",
+                "size": "1024",
+                "md5Checksum": "abc123",
+                "createdTime": "2024-01-01T12:00:00.000Z",
+                "modifiedTime": "2024-01-02T12:00:00.000Z",
+                "parents": [parent],
+            }
+            for i, parent in enumerate(["2024", "photos", "2024"])
+        ]
+    }
+
+    records = list(scanner.scan_files())
+
+    assert [r.path for r in records] == [
+        "/My Drive/Photos/2024",
+        "/My Drive/Photos",
+        "/My Drive/Photos/2024",
+    ]
+    # One batch per tree level, each folder fetched exactly once
+    assert mock_drive_service.new_batch_http_request.call_count == 2
+    assert mock_drive_service.files().get.call_count == len(FOLDERS)
+
+
+def test_scan_files_follows_pages(
+    scanner: DriveScanner, mock_drive_service: Mock
+) -> None:
+    """Test scanning requests each page with the previous page's token."""
+    pages = [
+        {
+            "files": [
+                {
+                    "id": f"file{i}",
+                    "name": f"photo{i}.jpg",
+                    "size": "1024",
+                    "md5Checksum": "abc123",
+                    "createdTime": "2024-01-01T12:00:00.000Z",
+                    "modifiedTime": "2024-01-02T12:00:00.000Z",
+                }
+            ],
+            **({"nextPageToken": f"token{i + 1}"} if i < 2 else {}),
+        }
+        for i in range(3)
+    ]
+    mock_drive_service.files().list.return_value.execute.side_effect = pages
+
+    records = list(scanner.scan_files())
+
+    assert [r.file_id for r in records] == ["file0", "file1", "file2"]
+    tokens = [
+        c.kwargs["pageToken"]
+        for c in mock_drive_service.files().list.call_args_list
+        if "pageToken" in c.kwargs
+    ]
+    assert tokens == [None, "token1", "token2"]
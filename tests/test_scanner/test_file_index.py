@@ -0,0 +1,169 @@
+"""Tests for the SQLite file index."""
+
+import sqlite3
+from dataclasses import replace
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from gdrive_dedup.detector.models import FileRecord
+from gdrive_dedup.scanner.file_index import FileIndex
+
+
+def test_add_and_find_duplicates(temp_db: Path, sample_files: list[FileRecord]) -> None:
+    """Test grouping indexed files by size and MD5."""
+    with FileIndex(temp_db) as file_index:
+        file_index.add_files(sample_files)
+
+        assert file_index.count_files() == 3
+        assert {k: sorted(v) for k, v in file_index.find_by_size().items()} == {
+            1024: ["file1", "file2", "file3"]
+        }
+        assert sorted(file_index.find_by_md5(["abc123"])["abc123"]) == [
+            "file1",
+            "file2",
+            "file3",
+        ]
+
+
+def test_get_files_by_ids(temp_db: Path, sample_files: list[FileRecord]) -> None:
+    """Test files round-trip through the index."""
+    with FileIndex(temp_db) as file_index:
+        file_index.add_files(sample_files)
+
+        files = file_index.get_files_by_ids(["file1", "file3"])
+
+    assert sorted(f.file_id for f in files) == ["file1", "file3"]
+    stored = next(f for f in files if f.file_id == "file1")
+    assert stored.path == sample_files[0].path
+    assert stored.md5 == sample_files[0].md5
+    # Naive datetimes are stored as UTC and come back timezone-aware
+    assert stored.modified_time == sample_files[0].modified_time.replace(tzinfo=timezone.utc)
+
+
+def test_add_file_is_visible_to_reads(temp_db: Path, sample_files: list[FileRecord]) -> None:
+    """Test files staged by add_file are written before the next read."""
+    with FileIndex(temp_db) as file_index:
+        for file in sample_files:
+            file_index.add_file(file)
+
+        assert file_index.count_files() == len(sample_files)
+        assert file_index.get_file("file1") is not None
+
+    with FileIndex(temp_db) as file_index:
+        file_index.clear()
+        file_index.add_file(sample_files[0])
+
+    # Closing flushes whatever is still staged
+    with FileIndex(temp_db) as file_index:
+        assert file_index.count_files() == 1
+
+
+def test_bulk_load(temp_db: Path, sample_files: list[FileRecord]) -> None:
+    """Test bulk loads restore indexes and persist rows."""
+    with FileIndex(temp_db) as file_index:
+        with file_index.bulk_load():
+            file_index.add_files(sample_files)
+
+        assert file_index.conn is not None
+        indexes = {
+            row[0]
+            for row in file_index.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'files'"
+            )
+            if not row[0].startswith("sqlite_autoindex")
+        }
+        assert indexes == {"idx_dedup", "idx_md5_nontrash"}
+
+    with FileIndex(temp_db) as file_index:
+        assert file_index.count_files() == 3
+
+
+def test_find_by_md5_with_comma_in_file_id(temp_db: Path, sample_files: list[FileRecord]) -> None:
+    """Test file IDs are returned intact even if they contain commas."""
+    files = [replace(f, file_id=f"{f.file_id},x") for f in sample_files]
+
+    with FileIndex(temp_db) as file_index:
+        file_index.add_files(files)
+
+        assert sorted(file_index.find_by_md5(["abc123"])["abc123"]) == [
+            "file1,x",
+            "file2,x",
+            "file3,x",
+        ]
+
+
+def test_lookups_with_many_keys(temp_db: Path, sample_file: FileRecord) -> None:
+    """Test lookups with more keys than SQLite can bind as parameters."""
+    files = [
+        replace(sample_file, file_id=f"file{i}", md5=f"md5-{i // 2}") for i in range(1500)
+    ]
+
+    with FileIndex(temp_db) as file_index:
+        file_index.add_files(files)
+
+        ids = [f.file_id for f in files]
+        assert len(file_index.get_files_by_ids(ids)) == 1500
+        duplicates = file_index.find_by_md5([f"md5-{i}" for i in range(750)])
+
+    assert len(duplicates) == 750
+    assert sorted(duplicates["md5-0"]) == ["file0", "file1"]
+
+
+_CREATE_TEXT_FILES_TABLE = """
+    CREATE TABLE files (
+        file_id TEXT PRIMARY KEY, name TEXT NOT NULL, size INTEGER NOT NULL,
+        md5 TEXT, mime_type TEXT NOT NULL, created_time TEXT NOT NULL,
+        modified_time TEXT NOT NULL, path TEXT NOT NULL,
+        trashed INTEGER NOT NULL DEFAULT 0, owned_by_me INTEGER NOT NULL DEFAULT 1
+    )
+"""
+
+
+def create_text_files_table(db_path: Path, created: str = "") -> None:
+    """Create a pre-migration files table holding one row with ISO 8601 timestamps."""
+    conn = sqlite3.connect(db_path)
+    conn.execute(_CREATE_TEXT_FILES_TABLE)
+    conn.execute(
+        "INSERT INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            "file1", "test.txt", 1024, "abc123", "text/plain",
+            created or "2024-01-01T12:00:00+00:00", "2024-01-02T12:00:00+00:00",
+            "/test.txt", 0, 1,
+        ),
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_migrates_text_timestamps(temp_db: Path) -> None:
+    """Test databases with ISO 8601 timestamps are converted on open."""
+    create_text_files_table(temp_db)
+    conn = sqlite3.connect(temp_db)
+    conn.execute("CREATE INDEX idx_size ON files(size)")
+    conn.commit()
+    conn.close()
+
+    with FileIndex(temp_db) as file_index:
+        stored = file_index.get_file("file1")
+
+    assert stored is not None
+    assert stored.created_time == datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+    assert stored.modified_time == datetime(2024, 1, 2, 12, tzinfo=timezone.utc)
+
+
+def test_failed_migration_is_rolled_back(temp_db: Path) -> None:
+    """Test a migration that fails part way leaves the original table intact."""
+    # Unparseable timestamps convert to NULL and violate NOT NULL
+    create_text_files_table(temp_db, created="not a timestamp")
+
+    with pytest.raises(sqlite3.IntegrityError):
+        FileIndex(temp_db)
+
+    conn = sqlite3.connect(temp_db)
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    rows = conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+    conn.close()
+    assert "files_old" not in tables
+    assert rows == 1
@@ -0,0 +1,111 @@
+"""Tests for scan checkpoints."""
+
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from gdrive_dedup.scanner.resume import CheckpointWriter, ScanCheckpoint
+
+
+def test_update_and_load(tmp_path: Path) -> None:
+    """Test an updated checkpoint can be loaded back."""
+    path = tmp_path / "state" / "checkpoint.json"
+    checkpoint = ScanCheckpoint(path)
+    checkpoint.update("token123", 42)
+    checkpoint.close()
+
+    loaded = ScanCheckpoint(path)
+
+    assert loaded.load()
+    assert loaded.page_token == "token123"
+    assert loaded.files_scanned == 42
+    assert loaded.last_update == checkpoint.last_update
+    # Written via a temporary file that is renamed into place
+    assert [p.name for p in path.parent.iterdir()] == ["checkpoint.json"]
+
+
+def test_load_version_1(tmp_path: Path) -> None:
+    """Test loading a checkpoint with an ISO 8601 timestamp."""
+    path = tmp_path / "checkpoint.json"
+    path.write_text(
+        '{"page_token": null, "files_scanned": 7, "last_update": "2024-01-02T03:04:05"}'
+    )
+    checkpoint = ScanCheckpoint(path)
+
+    assert checkpoint.load()
+    assert checkpoint.files_scanned == 7
+    assert checkpoint.last_update == datetime(2024, 1, 2, 3, 4, 5)
+
+
+def test_load_missing(tmp_path: Path) -> None:
+    """Test loading when no checkpoint exists."""
+    assert not ScanCheckpoint(tmp_path / "checkpoint.json").load()
+
+
+def test_clear(tmp_path: Path) -> None:
+    """Test clearing removes the file and resets state."""
+    path = tmp_path / "checkpoint.json"
+    checkpoint = ScanCheckpoint(path)
+    checkpoint.update("token123", 42)
+
+    checkpoint.clear()
+
+    assert not path.exists()
+    assert checkpoint.files_scanned == 0
+    assert not ScanCheckpoint(path).load()
+
+
+def test_latest_update_wins(tmp_path: Path) -> None:
+    """Test rapid updates end with the latest state on disk."""
+    path = tmp_path / "checkpoint.json"
+    checkpoint = ScanCheckpoint(path)
+    for files_scanned in range(1, 101):
+        checkpoint.update(None, files_scanned)
+    checkpoint.close()
+
+    loaded = ScanCheckpoint(path)
+
+    assert loaded.load()
+    assert loaded.files_scanned == 100
+
+
+def test_updates_are_debounced(tmp_path: Path) -> None:
+    """Test only updates past the file threshold are written until close."""
+    checkpoint = ScanCheckpoint(tmp_path / "checkpoint.json", min_files=10, min_interval=3600)
+
+    with patch.object(CheckpointWriter, "submit", autospec=True) as submit:
+        for files_scanned in range(1, 26):
+            checkpoint.update(None, files_scanned)
+
+        written = [c.args[1]["files_scanned"] for c in submit.call_args_list]
+        assert written == [10, 20]
+
+        checkpoint.close()
+
+        written = [c.args[1]["files_scanned"] for c in submit.call_args_list]
+        assert written == [10, 20, 25]
+
+
+def test_unwritable_directory_raises(tmp_path: Path) -> None:
+    """Test a directory that can't be created fails loudly instead of hanging."""
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    checkpoint = ScanCheckpoint(blocker / "checkpoint.json", min_files=1)
+
+    with pytest.raises(OSError):
+        checkpoint.update(None, 1)
+    with pytest.raises(OSError):
+        checkpoint.close()
+
+
+def test_close_unregisters_exit_hook(tmp_path: Path) -> None:
+    """Test close() drops the atexit hook so the checkpoint can be freed."""
+    with patch("gdrive_dedup.scanner.resume.atexit") as atexit:
+        checkpoint = ScanCheckpoint(tmp_path / "checkpoint.json")
+        atexit.register.assert_called_once_with(checkpoint.close)
+
+        checkpoint.close()
+
+    atexit.unregister.assert_called_once_with(checkpoint.close)